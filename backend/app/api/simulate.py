@@ -3,26 +3,80 @@ Circuit simulation API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Dict, Any
+import asyncio
 import time
 from datetime import datetime
 
+from app.core import metrics
+from app.core.coalescing import SingleFlight, CoalescingLimitError, canonical_hash
+from app.core.config import settings
 from app.core.db import get_db
 from app.models.circuit_model import SimulationRequest, SimulationResult
 from app.services.circuit_service import CircuitService
 
 router = APIRouter()
 
+simulation_flights = SingleFlight(
+    max_waiters=settings.SIMULATION_COALESCING_MAX_WAITERS,
+    timeout=settings.SIMULATION_COALESCING_TIMEOUT
+)
+
 
 @router.post("/run", response_model=SimulationResult)
 async def run_simulation(
     simulation_request: SimulationRequest,
     background_tasks: BackgroundTasks,
+    profile: bool = False,
     db: Session = Depends(get_db)
 ):
     """Run circuit simulation"""
-    start_time = time.time()
+    profiling = profile and settings.PROFILING_ENABLED
+    if profiling or not settings.SIMULATION_COALESCING_ENABLED:
+        return await run_in_threadpool(_simulate, simulation_request, profiling)
+    
+    # Identical concurrent requests share a single simulation
+    try:
+        return await simulation_flights.do(
+            _simulation_key(simulation_request),
+            lambda: run_in_threadpool(_simulate, simulation_request, False)
+        )
+    except CoalescingLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e)
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Simulation timed out"
+        )
+
+
+def _simulation_key(simulation_request: SimulationRequest) -> str:
+    """Hash only the request fields that affect the simulation result"""
+    # Names, positions, rotation, wire routing and circuit_id are layout only
+    return canonical_hash(simulation_request.model_dump(
+        mode="json",
+        include={
+            "components": {"__all__": {"id", "type", "properties"}},
+            "connections": {"__all__": {"from_component", "from_pin", "to_component", "to_pin"}},
+            "simulation_time": True,
+            "time_step": True,
+        }
+    ))
+
+
+def _simulate(simulation_request: SimulationRequest, profile: bool) -> SimulationResult:
+    """Run a simulation and build its result"""
+    # Imported on first use to keep the solver out of application startup
+    from app.services.simulation_service import SimulationService
+    
+    start_time = time.perf_counter()
+    service = SimulationService()
+    metadata: Dict[str, Any] = {"analysis": service.ANALYSIS_TYPE}
     
     try:
         # Validate circuit components and connections
@@ -32,69 +86,46 @@ async def run_simulation(
                 detail="No components provided for simulation"
             )
         
-        # Basic simulation logic (placeholder)
-        # In a real implementation, this would use a circuit simulation engine
-        simulation_data = {
-            "voltages": {},
-            "currents": {},
-            "power": {},
-            "time_points": [],
-            "component_states": {}
-        }
-        
-        # Simulate basic circuit analysis
-        for component in simulation_request.components:
-            component_id = component.id
-            component_type = component.type
-            
-            # Mock simulation results based on component type
-            if component_type == "battery":
-                voltage = component.properties.get("voltage", 9.0)
-                simulation_data["voltages"][component_id] = voltage
-                simulation_data["currents"][component_id] = 0.0
-                
-            elif component_type == "resistor":
-                resistance = component.properties.get("resistance", 1000.0)
-                # Mock current calculation (Ohm's law)
-                voltage = 5.0  # Assume 5V across resistor
-                current = voltage / resistance
-                simulation_data["voltages"][component_id] = voltage
-                simulation_data["currents"][component_id] = current
-                simulation_data["power"][component_id] = voltage * current
-                
-            elif component_type == "led":
-                # Mock LED simulation
-                forward_voltage = component.properties.get("forward_voltage", 2.0)
-                forward_current = component.properties.get("forward_current", 0.02)
-                simulation_data["voltages"][component_id] = forward_voltage
-                simulation_data["currents"][component_id] = forward_current
-                simulation_data["component_states"][component_id] = "on"
+        if profile:
+            from app.core.profiling import profile_call, format_profile, store_profile
+            simulation_data, profiler = profile_call(service.run, simulation_request)
+            metadata["profile"] = format_profile(profiler)
+            if time.perf_counter() - start_time >= settings.PROFILE_SLOW_SIMULATION_TIME:
+                metadata["profile_file"] = store_profile(profiler)
+        else:
+            simulation_data = service.run(simulation_request)
         
-        # Generate time points for the simulation
-        time_step = simulation_request.time_step
-        sim_time = simulation_request.simulation_time
-        time_points = [i * time_step for i in range(int(sim_time / time_step) + 1)]
-        simulation_data["time_points"] = time_points
-        
-        execution_time = time.time() - start_time
-        
-        return SimulationResult(
-            success=True,
-            message="Simulation completed successfully",
-            data=simulation_data,
-            execution_time=execution_time,
-            timestamp=datetime.now()
-        )
+        with service.timer.phase("result"):
+            result = SimulationResult(
+                success=True,
+                message="Simulation completed successfully",
+                data=simulation_data,
+                execution_time=0.0,
+                timestamp=datetime.now(),
+                metadata=metadata
+            )
         
     except Exception as e:
-        execution_time = time.time() - start_time
-        return SimulationResult(
+        result = SimulationResult(
             success=False,
             message=f"Simulation failed: {str(e)}",
             data=None,
-            execution_time=execution_time,
-            timestamp=datetime.now()
+            execution_time=0.0,
+            timestamp=datetime.now(),
+            metadata=metadata
         )
+    
+    result.execution_time = time.perf_counter() - start_time
+    result.metadata["timings"] = dict(service.timer.timings)
+    _record_simulation_metrics(service.ANALYSIS_TYPE, service.timer.timings, result.execution_time)
+    return result
+
+
+def _record_simulation_metrics(analysis: str, timings: Dict[str, float], execution_time: float):
+    """Record simulation duration and per-phase timings"""
+    metrics.simulation_duration.observe(execution_time, analysis=analysis)
+    for phase, duration in timings.items():
+        metrics.simulation_phase_duration.observe(duration, analysis=analysis, phase=phase)
 
 
 @router.post("/validate")
@@ -105,6 +136,14 @@ async def validate_circuit(simulation_request: SimulationRequest):
         errors = []
         warnings = []
         
+        # Check circuit size against the simulation limit
+        component_count = len(simulation_request.components)
+        if component_count > settings.MAX_COMPONENTS:
+            errors.append(
+                f"Circuit has {component_count} components, "
+                f"maximum is {settings.MAX_COMPONENTS}"
+            )
+        
         # Check for required components
         has_power_source = any(
             comp.type in ["battery", "power_supply"] 
@@ -137,7 +176,7 @@ async def validate_circuit(simulation_request: SimulationRequest):
             "valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
-            "component_count": len(simulation_request.components),
+            "component_count": component_count,
             "connection_count": len(simulation_request.connections)
         }
         
@@ -0,0 +1,71 @@
+"""
+Single-flight coalescing of identical concurrent requests
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CoalescingLimitError(Exception):
+    """Raised when too many callers are already waiting on one key"""
+
+
+class _Flight:
+    """One in-flight computation and the callers sharing it"""
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight computation between concurrent callers with the same key"""
+
+    def __init__(self, max_waiters: int, timeout: float):
+        self.max_waiters = max_waiters
+        self.timeout = timeout
+        self._flights: Dict[str, _Flight] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` unless an identical call is in flight, then await its result"""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight()
+            self._flights[key] = flight
+            flight.task = asyncio.ensure_future(self._run(key, flight, func))
+            flight.task.add_done_callback(_consume_exception)
+        elif flight.waiters >= self.max_waiters:
+            raise CoalescingLimitError(
+                f"Too many concurrent requests waiting on the same computation ({self.max_waiters})"
+            )
+
+        flight.waiters += 1
+        try:
+            # Shield the shared task so one caller timing out does not cancel it for the rest
+            return await asyncio.wait_for(asyncio.shield(flight.task), self.timeout)
+        finally:
+            flight.waiters -= 1
+
+    async def _run(self, key: str, flight: _Flight, func: Callable[[], Awaitable[T]]) -> T:
+        """Run the computation and forget the key once it finishes"""
+        try:
+            return await func()
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+def _consume_exception(task: asyncio.Task):
+    """Retrieve the exception so abandoned flights do not log warnings"""
+    if not task.cancelled():
+        task.exception()
+
+
+def canonical_hash(payload: Any) -> str:
+    """Hash a JSON-compatible payload independent of key order and formatting"""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
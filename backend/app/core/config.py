@@ -50,6 +50,20 @@ class Settings(BaseSettings):
     MAX_SIMULATION_TIME: int = 60  # seconds
     MAX_COMPONENTS: int = 1000
     
+    # Request coalescing for identical concurrent simulations
+    SIMULATION_COALESCING_ENABLED: bool = True
+    SIMULATION_COALESCING_MAX_WAITERS: int = 200  # per request key
+    SIMULATION_COALESCING_TIMEOUT: float = 60.0  # seconds
+    
+    # Profiling
+    PROFILING_ENABLED: bool = False  # Allow ?profile=true on simulation requests
+    PROFILE_SLOW_SIMULATION_TIME: float = 1.0  # seconds; slower profiles are stored
+    PROFILE_DIR: str = "profiles"
+    PROFILE_TOP_FUNCTIONS: int = 30
+    
+    # Startup
+    WARMUP_ON_STARTUP: bool = False  # Preload solver and database in the background
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
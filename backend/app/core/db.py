@@ -3,30 +3,61 @@ Database configuration and session management
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, Optional
+import threading
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
-)
+# SQLAlchemy engine, created on first use by init_db()
+engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class (bound to the engine by init_db())
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 # Create Base class for models
 Base = declarative_base()
 
 
+def init_db() -> Engine:
+    """Create the engine on first call and bind sessions to it"""
+    global engine
+    if engine is not None:
+        return engine
+
+    # get_db runs in threadpool workers, so concurrent first requests race here
+    with _engine_lock:
+        if engine is None:
+            # SQLite connections are shared between the threadpool and the event loop
+            connect_args = {}
+            if settings.database_url.startswith("sqlite"):
+                connect_args["check_same_thread"] = False
+
+            created = create_engine(
+                settings.database_url,
+                pool_pre_ping=True,
+                echo=settings.DEBUG,
+                connect_args=connect_args
+            )
+            SessionLocal.configure(bind=created)
+            engine = created
+    return engine
+
+
+def dispose_db():
+    """Close pooled connections"""
+    if engine is not None:
+        engine.dispose()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get database session
     """
+    init_db()
     db = SessionLocal()
     try:
         yield db
@@ -36,9 +67,9 @@ def get_db() -> Generator[Session, None, None]:
 
 def create_tables():
     """Create all tables"""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=init_db())
 
 
 def drop_tables():
     """Drop all tables"""
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=init_db())
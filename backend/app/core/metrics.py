@@ -0,0 +1,117 @@
+"""
+Request and simulation metrics with Prometheus text exposition
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond API calls to long simulations
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+class Histogram:
+    """Thread-safe histogram with one series per label combination"""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str):
+        """Record one observation"""
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            # Per-bucket counts followed by +Inf count and running sum
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        """Render the histogram in Prometheus text format"""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+
+        for key, values in sorted(series.items()):
+            labels = [f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, key)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), values[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = ",".join(labels + [f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            label_text = "{" + ",".join(labels) + "}" if labels else ""
+            lines.append(f"{self.name}_sum{label_text} {values[-1]}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class PhaseTimer:
+    """Collect monotonic per-phase timings in seconds"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of work, accumulating repeated phases"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+http_request_duration = Histogram(
+    "circuitgen_http_request_duration_seconds",
+    "HTTP request latency by endpoint",
+    ["method", "path", "status"]
+)
+
+simulation_duration = Histogram(
+    "circuitgen_simulation_duration_seconds",
+    "Simulation run time by analysis type",
+    ["analysis"]
+)
+
+simulation_phase_duration = Histogram(
+    "circuitgen_simulation_phase_duration_seconds",
+    "Simulation run time by phase",
+    ["analysis", "phase"]
+)
+
+REGISTRY = [http_request_duration, simulation_duration, simulation_phase_duration]
+
+
+def render_metrics() -> str:
+    """Render every registered metric"""
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
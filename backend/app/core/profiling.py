@@ -0,0 +1,40 @@
+"""
+Opt-in profiling for slow simulations
+"""
+
+import cProfile
+import io
+import pstats
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from app.core.config import settings
+
+
+def profile_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, cProfile.Profile]:
+    """Run ``func`` under cProfile and return its result with the profile"""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    return result, profiler
+
+
+def format_profile(profiler: cProfile.Profile, limit: Optional[int] = None) -> str:
+    """Format the most expensive calls by cumulative time"""
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit or settings.PROFILE_TOP_FUNCTIONS)
+    return stream.getvalue()
+
+
+def store_profile(profiler: cProfile.Profile, prefix: str = "simulation") -> str:
+    """Dump profile stats to PROFILE_DIR for use with pstats or snakeviz.
+
+    Returns only the file name; the full path is logged on the server.
+    """
+    profile_dir = Path(settings.PROFILE_DIR)
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    path = profile_dir / f"{prefix}-{uuid.uuid4().hex}.prof"
+    profiler.dump_stats(str(path))
+    print(f"📄 Stored simulation profile at {path.resolve()}")
+    return path.name
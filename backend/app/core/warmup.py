@@ -0,0 +1,56 @@
+"""
+Optional background warm-up of heavy subsystems after startup
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from app.core.db import init_db
+
+# Seconds taken by the last warm-up, None until it has finished
+warm_up_time: Optional[float] = None
+
+
+def warm_up():
+    """Import the solver, run a tiny simulation and open a database connection"""
+    global warm_up_time
+    start_time = time.perf_counter()
+
+    from app.models.circuit_model import Component, Connection, SimulationRequest
+    from app.services.simulation_service import SimulationService
+
+    request = SimulationRequest(
+        components=[
+            Component(id="battery", type="battery", name="Battery", position={"x": 0, "y": 0}),
+            Component(id="resistor", type="resistor", name="Resistor", position={"x": 1, "y": 0}),
+            Component(id="ground", type="ground", name="Ground", position={"x": 2, "y": 0}),
+        ],
+        connections=[
+            Connection(id="c1", from_component="battery", from_pin="out",
+                       to_component="resistor", to_pin="in"),
+            Connection(id="c2", from_component="resistor", from_pin="out",
+                       to_component="ground", to_pin="gnd"),
+        ],
+        simulation_time=0.01,
+        time_step=0.01
+    )
+    SimulationService().run(request)
+
+    with init_db().connect():
+        pass
+
+    warm_up_time = time.perf_counter() - start_time
+
+
+async def warm_up_in_background():
+    """Run warm-up in a worker thread without blocking the event loop.
+
+    Started from the lifespan right after startup, so it may overlap with the
+    server beginning to accept requests; requests never wait for it.
+    """
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, warm_up)
+        print(f"🔥 Warm-up finished in {warm_up_time:.3f}s")
+    except Exception as e:
+        print(f"⚠️ Warm-up failed: {e}")
@@ -2,13 +2,18 @@
 CircuitGen Backend - FastAPI Application Entry Point
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
+import asyncio
+import time
 
 from app.api import circuits, simulate
+from app.core import metrics
 from app.core.config import settings
+from app.core.db import init_db, dispose_db
+from app.core.warmup import warm_up_in_background
 
 
 @asynccontextmanager
@@ -16,9 +21,16 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     print("🚀 CircuitGen Backend starting up...")
+    init_db()
+    warm_up_task = None
+    if settings.WARMUP_ON_STARTUP:
+        warm_up_task = asyncio.create_task(warm_up_in_background())
     yield
     # Shutdown
     print("🛑 CircuitGen Backend shutting down...")
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+    dispose_db()
 
 
 # Create FastAPI application
@@ -38,6 +50,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# Record request latency per endpoint
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Observe request duration by route template"""
+    start_time = time.perf_counter()
+    status_code = 500  # Reported when the handler raises
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        metrics.http_request_duration.observe(
+            time.perf_counter() - start_time,
+            method=request.method,
+            path=getattr(route, "path", "unmatched"),
+            status=str(status_code)
+        )
+
 # Include API routers
 app.include_router(circuits.router, prefix="/api/v1/circuits", tags=["circuits"])
 app.include_router(simulate.router, prefix="/api/v1/simulate", tags=["simulation"])
@@ -48,6 +80,15 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "CircuitGen Backend"}
 
+# Metrics endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus metrics endpoint"""
+    return PlainTextResponse(
+        metrics.render_metrics(),
+        media_type="text/plain; version=0.0.4"
+    )
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -56,7 +97,8 @@ async def root():
         "message": "Welcome to CircuitGen API",
         "version": "1.0.0",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "metrics": "/metrics"
     }
 
 
@@ -36,7 +36,7 @@ class Circuit(Base):
     description = Column(Text)
     components = Column(JSON)  # Store circuit components as JSON
     connections = Column(JSON)  # Store connections between components
-    metadata = Column(JSON)  # Additional circuit metadata
+    circuit_metadata = Column("metadata", JSON)  # Additional circuit metadata
     is_public = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -117,3 +117,4 @@ class SimulationResult(BaseModel):
     data: Optional[Dict[str, Any]] = None
     execution_time: float
     timestamp: datetime
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Analysis type, phase timings and profile")
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
+from app.core.config import settings
 from app.models.circuit_model import (
     Circuit, CircuitCreate, CircuitUpdate, CircuitResponse
 )
@@ -50,7 +51,7 @@ class CircuitService:
             description=circuit_data.description,
             components=[comp.dict() for comp in circuit_data.components],
             connections=[conn.dict() for conn in circuit_data.connections],
-            metadata=circuit_data.metadata,
+            circuit_metadata=circuit_data.metadata,
             is_public=circuit_data.is_public
         )
         
@@ -80,7 +81,7 @@ class CircuitService:
         if circuit_data.connections is not None:
             circuit.connections = [conn.dict() for conn in circuit_data.connections]
         if circuit_data.metadata is not None:
-            circuit.metadata = circuit_data.metadata
+            circuit.circuit_metadata = circuit_data.metadata
         if circuit_data.is_public is not None:
             circuit.is_public = circuit_data.is_public
         
@@ -125,7 +126,7 @@ class CircuitService:
             description=original.description,
             components=original.components,
             connections=original.connections,
-            metadata=original.metadata,
+            circuit_metadata=original.circuit_metadata,
             is_public=False  # Duplicates are private by default
         )
         
@@ -146,7 +147,7 @@ class CircuitService:
             "description": circuit.description,
             "components": circuit.components,
             "connections": circuit.connections,
-            "metadata": circuit.metadata,
+            "metadata": circuit.circuit_metadata,
             "exported_at": datetime.utcnow().isoformat()
         }
     
@@ -163,7 +164,7 @@ class CircuitService:
             description=circuit.description,
             components=components,
             connections=connections,
-            metadata=circuit.metadata or {},
+            metadata=circuit.circuit_metadata or {},
             is_public=circuit.is_public,
             created_at=circuit.created_at,
             updated_at=circuit.updated_at
@@ -174,6 +175,13 @@ class CircuitService:
         if not components:
             return  # Empty circuit is valid
         
+        # Reject circuits that could never be simulated
+        if len(components) > settings.MAX_COMPONENTS:
+            raise ValueError(
+                f"Circuit has {len(components)} components, "
+                f"maximum is {settings.MAX_COMPONENTS}"
+            )
+        
         # Check for duplicate component IDs
         component_ids = [comp.id for comp in components]
         if len(component_ids) != len(set(component_ids)):
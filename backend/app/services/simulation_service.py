@@ -0,0 +1,89 @@
+"""
+Simulation service for circuit analysis
+"""
+
+from typing import Dict, Any, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import PhaseTimer
+from app.models.circuit_model import SimulationRequest, Component
+
+
+class SimulationService:
+    """Service class for circuit simulation"""
+
+    ANALYSIS_TYPE = "dc"
+
+    def __init__(self, timer: Optional[PhaseTimer] = None):
+        self.timer = timer or PhaseTimer()
+
+    def run(self, simulation_request: SimulationRequest) -> Dict[str, Any]:
+        """Run a simulation and return the raw result data"""
+        components = simulation_request.components
+
+        with self.timer.phase("validate"):
+            self._validate_size(components)
+
+        simulation_data = {
+            "voltages": {},
+            "currents": {},
+            "power": {},
+            "time_points": [],
+            "component_states": {}
+        }
+
+        with self.timer.phase("solve"):
+            self._analyse(components, simulation_data)
+
+        with self.timer.phase("time_points"):
+            simulation_data["time_points"] = self._time_points(
+                simulation_request.simulation_time,
+                simulation_request.time_step
+            )
+        return simulation_data
+
+    def _validate_size(self, components: List[Component]):
+        """Validate circuit size against configured limits"""
+        if len(components) > settings.MAX_COMPONENTS:
+            raise ValueError(
+                f"Circuit has {len(components)} components, "
+                f"maximum is {settings.MAX_COMPONENTS}"
+            )
+
+    def _analyse(self, components: List[Component], simulation_data: Dict[str, Any]):
+        """Compute per-component results"""
+        voltages = simulation_data["voltages"]
+        currents = simulation_data["currents"]
+        power = simulation_data["power"]
+        states = simulation_data["component_states"]
+
+        for component in components:
+            component_id = component.id
+            component_type = component.type
+
+            # Mock simulation results based on component type
+            if component_type == "battery":
+                voltage = component.properties.get("voltage", 9.0)
+                voltages[component_id] = voltage
+                currents[component_id] = 0.0
+
+            elif component_type == "resistor":
+                resistance = component.properties.get("resistance", 1000.0)
+                # Mock current calculation (Ohm's law)
+                voltage = 5.0  # Assume 5V across resistor
+                current = voltage / resistance
+                voltages[component_id] = voltage
+                currents[component_id] = current
+                power[component_id] = voltage * current
+
+            elif component_type == "led":
+                # Mock LED simulation
+                forward_voltage = component.properties.get("forward_voltage", 2.0)
+                forward_current = component.properties.get("forward_current", 0.02)
+                voltages[component_id] = forward_voltage
+                currents[component_id] = forward_current
+                states[component_id] = "on"
+
+    def _time_points(self, simulation_time: float, time_step: float) -> List[float]:
+        """Generate time points for the simulation"""
+        return [i * time_step for i in range(int(simulation_time / time_step) + 1)]
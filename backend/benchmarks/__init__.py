@@ -0,0 +1 @@
+# CircuitGen Benchmarks
@@ -0,0 +1,122 @@
+"""
+Import time and time-to-first-request benchmark
+
+Usage:
+    python -m benchmarks.bench_import --repeat 10 --output import.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Any, List
+
+from benchmarks.common import configure_environment, summarize, write_results
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Modules that should only load on first use, never while importing the app
+LAZY_MODULES = [
+    "app.services.simulation_service",
+    "app.core.profiling",
+    "cProfile",
+    "numpy",
+    "scipy",
+]
+
+# Runs in a fresh interpreter so every sample is a cold start
+COLD_START_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+loaded = [name for name in {lazy_modules!r} if name in sys.modules]
+
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    started = time.perf_counter()
+    client.get("/health")
+    first_request = time.perf_counter()
+    client.post("/api/v1/simulate/run", json={{
+        "components": [
+            {{"id": "b", "type": "battery", "name": "B", "position": {{"x": 0, "y": 0}}}},
+            {{"id": "r", "type": "resistor", "name": "R", "position": {{"x": 1, "y": 0}}}}
+        ],
+        "connections": [
+            {{"id": "c", "from_component": "b", "from_pin": "out", "to_component": "r", "to_pin": "in"}}
+        ]
+    }})
+    first_simulation = time.perf_counter()
+
+print(json.dumps({{
+    "import": imported - start,
+    "startup": started - imported,
+    "first_request": first_request - start,
+    "first_simulation": first_simulation - first_request,
+    "eager_lazy_modules": loaded
+}}))
+"""
+
+
+def cold_start() -> Dict[str, Any]:
+    """Measure one cold start in a subprocess"""
+    script = COLD_START_SCRIPT.format(lazy_modules=LAZY_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", script], cwd=BACKEND_DIR, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_profile(limit: int) -> List[Dict[str, Any]]:
+    """Return the slowest modules by cumulative import time"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = (field.strip() for field in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue  # Header line
+        modules.append({
+            "module": name,
+            "self": int(self_us) / 1e6,
+            "cumulative": int(cumulative_us) / 1e6
+        })
+    modules.sort(key=lambda module: module["cumulative"], reverse=True)
+    return modules[:limit]
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25, help="Slowest imports to record")
+    parser.add_argument("--output", help="Path of the JSON results file")
+    args = parser.parse_args(argv)
+
+    configure_environment()
+
+    samples = []
+    for index in range(args.repeat):
+        print(f"Cold start {index + 1}/{args.repeat}...")
+        samples.append(cold_start())
+
+    results = {
+        phase: summarize([sample[phase] for sample in samples])
+        for phase in ("import", "startup", "first_request", "first_simulation")
+    }
+    results["eager_lazy_modules"] = sorted({
+        name for sample in samples for name in sample["eager_lazy_modules"]
+    })
+    results["slowest_imports"] = import_profile(args.top)
+
+    if results["eager_lazy_modules"]:
+        print(f"Warning: loaded at import time: {', '.join(results['eager_lazy_modules'])}")
+
+    path = write_results("import", results, vars(args), args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Load test harness for the FastAPI application on SQLite
+
+Usage:
+    python -m benchmarks.bench_load --requests 500 --concurrency 20 --output load.json
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, Any, List, Callable, Awaitable
+
+import httpx
+
+from benchmarks.common import (
+    TOPOLOGIES, add_database_argument, configure_environment, describe_database,
+    summarize, write_results
+)
+
+# Modules under app read settings on import, so they are imported after
+# configure_environment() has selected the benchmark database
+
+
+async def run_scenario(
+    name: str,
+    send: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]],
+    client: httpx.AsyncClient,
+    total: int,
+    concurrency: int
+) -> Dict[str, Any]:
+    """Fire ``total`` requests with at most ``concurrency`` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(index: int):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await send(client, index)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    print(f"Load testing {name}...")
+    start = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(total)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": total,
+        "errors": errors,
+        "elapsed": elapsed,
+        "throughput": total / elapsed,
+        "latency": summarize(latencies),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every scenario against the benchmark database"""
+    from app.core.db import create_tables
+    from app.main import app
+    from benchmarks.generator import (
+        CircuitGenerator, as_circuit_create, as_simulation_request, as_payload
+    )
+
+    # Existing tables are kept; the default database is a fresh temporary file
+    create_tables()
+
+    generator = CircuitGenerator(args.seed)
+    netlists = [
+        generator.generate(TOPOLOGIES[index % len(TOPOLOGIES)], args.size)
+        for index in range(args.templates)
+    ]
+    circuits = [
+        as_payload(as_circuit_create(netlist, name=f"bench-{index}", is_public=index % 2 == 0))
+        for index, netlist in enumerate(netlists)
+    ]
+    simulations = [as_payload(as_simulation_request(netlist)) for netlist in netlists]
+
+    created_ids: List[int] = []
+
+    async def create_circuit(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        response = await client.post("/api/v1/circuits/", json=circuits[index % len(circuits)])
+        if response.status_code == 201:
+            created_ids.append(response.json()["id"])
+        return response
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        results = {}
+        results["create_circuit"] = await run_scenario(
+            "create_circuit", create_circuit, client, args.requests, args.concurrency
+        )
+        results["get_circuits"] = await run_scenario(
+            "get_circuits",
+            lambda c, i: c.get("/api/v1/circuits/", params={"limit": args.page_size}),
+            client, args.requests, args.concurrency
+        )
+        if created_ids:
+            results["get_circuit"] = await run_scenario(
+                "get_circuit",
+                lambda c, i: c.get(f"/api/v1/circuits/{created_ids[i % len(created_ids)]}"),
+                client, args.requests, args.concurrency
+            )
+        results["simulate_validate"] = await run_scenario(
+            "simulate_validate",
+            lambda c, i: c.post("/api/v1/simulate/validate", json=simulations[i % len(simulations)]),
+            client, args.requests, args.concurrency
+        )
+        results["simulate_run"] = await run_scenario(
+            "simulate_run",
+            lambda c, i: c.post("/api/v1/simulate/run", json=simulations[i % len(simulations)]),
+            client, args.requests, args.concurrency
+        )
+    return results
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--size", type=int, default=50, help="Generator size of each circuit")
+    parser.add_argument("--templates", type=int, default=8, help="Distinct circuits to cycle through")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Path of the JSON results file")
+    add_database_argument(parser)
+    args = parser.parse_args(argv)
+
+    configure_environment(args.database_url)
+    results = asyncio.run(run(args))
+    parameters = {**vars(args), "database_url": describe_database(args.database_url)}
+    path = write_results("load", results, parameters, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Micro-benchmarks for serialization, validation and simulation hot paths
+
+Usage:
+    python -m benchmarks.bench_micro --sizes 10 100 1000 --output micro.json
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, Any, List
+
+from benchmarks.common import (
+    TOPOLOGIES, add_database_argument, configure_environment, describe_database,
+    summarize, write_results
+)
+
+# Modules under app read settings on import, so they are imported after
+# configure_environment() has selected the benchmark database
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Time ``func`` with enough inner loops to exceed timer resolution"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    result = summarize(samples)
+    result["loops"] = number
+    return result
+
+
+def bench_netlist(topology: str, size: int, seed: int, repeat: int) -> Dict[str, Any]:
+    """Benchmark the service-level hot paths for one generated circuit"""
+    from app.models.circuit_model import Circuit
+    from app.services.circuit_service import CircuitService
+    from app.services.simulation_service import SimulationService
+    from benchmarks.generator import CircuitGenerator, as_simulation_request
+
+    components, connections = CircuitGenerator(seed).generate(topology, size)
+    request = as_simulation_request((components, connections))
+
+    db_circuit = Circuit(
+        id=1,
+        name=f"{topology}-{size}",
+        description=None,
+        components=[comp.dict() for comp in components],
+        connections=[conn.dict() for conn in connections],
+        circuit_metadata={},
+        is_public=True,
+        created_at=datetime.now(),
+        updated_at=None
+    )
+    circuit_service = CircuitService(db=None)
+    simulation_service = SimulationService()
+
+    return {
+        "components": len(components),
+        "connections": len(connections),
+        "serialize": measure(lambda: circuit_service._to_response(db_circuit), repeat),
+        "validate": measure(
+            lambda: circuit_service._validate_circuit_data(components, connections), repeat
+        ),
+        "simulate": measure(lambda: simulation_service.run(request), repeat),
+    }
+
+
+def bench_get_circuits(size: int, count: int, seed: int, repeat: int) -> Dict[str, Any]:
+    """Benchmark listing stored circuits from the database"""
+    from app.core.db import SessionLocal, create_tables
+    from app.models.circuit_model import Circuit
+    from app.services.circuit_service import CircuitService
+    from benchmarks.generator import CircuitGenerator
+
+    # Existing tables are kept; the default database is a fresh temporary file
+    create_tables()
+    generator = CircuitGenerator(seed)
+    db = SessionLocal()
+    try:
+        for index in range(count):
+            components, connections = generator.generate(TOPOLOGIES[index % len(TOPOLOGIES)], size)
+            db.add(Circuit(
+                name=f"bench-{index}",
+                components=[comp.dict() for comp in components],
+                connections=[conn.dict() for conn in connections],
+                circuit_metadata={},
+                is_public=index % 2 == 0
+            ))
+        db.commit()
+
+        service = CircuitService(db)
+        return {
+            "circuits": count,
+            "size": size,
+            "all": measure(lambda: service.get_circuits(limit=count), repeat),
+            "public_only": measure(
+                lambda: service.get_circuits(limit=count, public_only=True), repeat
+            ),
+        }
+    finally:
+        db.close()
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--topologies", nargs="+", default=list(TOPOLOGIES), choices=TOPOLOGIES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stored-circuits", type=int, default=100)
+    parser.add_argument("--output", help="Path of the JSON results file")
+    add_database_argument(parser)
+    args = parser.parse_args(argv)
+
+    configure_environment(args.database_url)
+
+    results: Dict[str, Any] = {"netlists": {}, "get_circuits": {}}
+    for topology in args.topologies:
+        for size in args.sizes:
+            key = f"{topology}-{size}"
+            print(f"Benchmarking {key}...")
+            results["netlists"][key] = bench_netlist(topology, size, args.seed, args.repeat)
+
+    print("Benchmarking get_circuits...")
+    results["get_circuits"] = bench_get_circuits(
+        min(args.sizes), args.stored_circuits, args.seed, args.repeat
+    )
+
+    parameters = {**vars(args), "database_url": describe_database(args.database_url)}
+    path = write_results("micro", results, parameters, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
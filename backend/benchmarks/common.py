@@ -0,0 +1,111 @@
+"""
+Shared helpers for benchmark scripts
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Circuit shapes produced by benchmarks.generator.CircuitGenerator
+TOPOLOGIES = ("ladder", "mesh", "rc_chain", "led_array")
+
+
+def configure_environment(database_url: Optional[str] = None):
+    """Point the application at the benchmark database.
+
+    Uses a fresh temporary SQLite file unless ``database_url`` is given
+    explicitly; an existing DATABASE_URL in the environment is ignored.
+
+    Must run before anything under ``app`` is imported, since settings are
+    read at import time.
+    """
+    if "app.core.config" in sys.modules:
+        raise RuntimeError("configure_environment() must run before importing app")
+
+    if database_url is None:
+        db_path = Path(tempfile.mkdtemp(prefix="circuitgen-bench-")) / "bench.db"
+        database_url = f"sqlite:///{db_path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("DEBUG", "False")
+
+
+def add_database_argument(parser: argparse.ArgumentParser):
+    """Add the --database-url option shared by database benchmarks"""
+    parser.add_argument(
+        "--database-url",
+        help="Benchmark against this database instead of a temporary SQLite file; "
+             "existing tables are never dropped"
+    )
+
+
+def describe_database(database_url: Optional[str]) -> str:
+    """Describe the benchmark database without leaking credentials"""
+    if database_url is None:
+        return "temporary sqlite"
+    return database_url.split(":", 1)[0]
+
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit, if available"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize timing samples in seconds"""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def write_results(
+    suite: str,
+    results: Dict[str, Any],
+    parameters: Dict[str, Any],
+    output: Optional[str] = None
+) -> Path:
+    """Write benchmark results as JSON and return the output path"""
+    commit = git_commit()
+    payload = {
+        "suite": suite,
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": results,
+    }
+
+    if output:
+        path = Path(output)
+    else:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        path = RESULTS_DIR / f"{suite}-{(commit or 'unknown')[:12]}.json"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2))
+    return path
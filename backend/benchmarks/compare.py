@@ -0,0 +1,58 @@
+"""
+Compare two benchmark result files
+
+Usage:
+    python -m benchmarks.compare results/micro-old.json results/micro-new.json
+"""
+
+import argparse
+import json
+from typing import Dict, Any, Iterator, Tuple, List
+
+# Timing statistics compared between runs, per suite
+METRICS = {"micro": "median", "load": "p95", "import": "median"}
+
+
+def timings(results: Dict[str, Any], metric: str, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yield (name, seconds) for every timing summary in a results tree"""
+    for key, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        name = f"{prefix}{key}"
+        if metric in value and "count" in value:
+            yield name, value[metric]
+        else:
+            yield from timings(value, metric, f"{name}.")
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    metric = METRICS.get(baseline["suite"], "median")
+    old = dict(timings(baseline["results"], metric))
+    new = dict(timings(candidate["results"], metric))
+
+    regressions = 0
+    print(f"{'benchmark':<50} {'baseline':>12} {'candidate':>12} {'change':>8}")
+    for name in sorted(old.keys() & new.keys()):
+        change = (new[name] - old[name]) / old[name] if old[name] else 0.0
+        flag = " !" if change > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{name:<50} {old[name] * 1e3:>10.3f}ms {new[name] * 1e3:>10.3f}ms {change:>+7.1%}{flag}")
+
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
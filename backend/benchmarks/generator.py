@@ -0,0 +1,172 @@
+"""
+Seeded generator for synthetic benchmark circuits
+"""
+
+import random
+from typing import List, Tuple, Dict, Any
+
+from app.models.circuit_model import (
+    Component, Connection, CircuitCreate, SimulationRequest
+)
+
+Netlist = Tuple[List[Component], List[Connection]]
+
+# Standard E12 resistor values used to pick realistic component values
+E12 = [1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2]
+
+
+class CircuitGenerator:
+    """Generate reproducible synthetic circuits of configurable size"""
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+        self._component_count = 0
+        self._connection_count = 0
+
+    def generate(self, topology: str, size: int) -> Netlist:
+        """Generate a circuit by topology name"""
+        if topology == "ladder":
+            return self.resistor_ladder(size)
+        if topology == "mesh":
+            side = max(2, int(size ** 0.5))
+            return self.mesh(side, side)
+        if topology == "rc_chain":
+            return self.rc_chain(size)
+        if topology == "led_array":
+            return self.led_array(size)
+        raise ValueError(f"Unknown topology: {topology}")
+
+    def resistor_ladder(self, rungs: int) -> Netlist:
+        """Battery driving an R-2R style ladder with ``rungs`` sections"""
+        components, connections = self._source()
+        battery, ground = components
+        previous = battery.id
+
+        for _ in range(rungs):
+            series = self._component("resistor", resistance=self._resistance())
+            shunt = self._component("resistor", resistance=self._resistance())
+            components += [series, shunt]
+            connections.append(self._connection(previous, "out", series.id, "in"))
+            connections.append(self._connection(series.id, "out", shunt.id, "in"))
+            connections.append(self._connection(shunt.id, "out", ground.id, "gnd"))
+            previous = series.id
+
+        return components, connections
+
+    def mesh(self, rows: int, cols: int) -> Netlist:
+        """Grid of nodes joined by resistors, driven from one corner"""
+        components, connections = self._source()
+        battery, ground = components
+        nodes = [[self._component("wire") for _ in range(cols)] for _ in range(rows)]
+
+        for row in range(rows):
+            for col in range(cols):
+                node = nodes[row][col]
+                components.append(node)
+                neighbours = []
+                if col + 1 < cols:
+                    neighbours.append(nodes[row][col + 1])
+                if row + 1 < rows:
+                    neighbours.append(nodes[row + 1][col])
+                for neighbour in neighbours:
+                    resistor = self._component("resistor", resistance=self._resistance())
+                    components.append(resistor)
+                    connections.append(self._connection(node.id, "out", resistor.id, "in"))
+                    connections.append(self._connection(resistor.id, "out", neighbour.id, "in"))
+
+        connections.append(self._connection(battery.id, "out", nodes[0][0].id, "in"))
+        connections.append(self._connection(nodes[-1][-1].id, "out", ground.id, "gnd"))
+        return components, connections
+
+    def rc_chain(self, stages: int) -> Netlist:
+        """Cascade of RC low-pass filter stages"""
+        components, connections = self._source()
+        battery, ground = components
+        previous = battery.id
+
+        for _ in range(stages):
+            resistor = self._component("resistor", resistance=self._resistance())
+            capacitor = self._component(
+                "capacitor",
+                capacitance=self.random.choice(E12) * 10 ** self.random.randint(-9, -5)
+            )
+            components += [resistor, capacitor]
+            connections.append(self._connection(previous, "out", resistor.id, "in"))
+            connections.append(self._connection(resistor.id, "out", capacitor.id, "in"))
+            connections.append(self._connection(capacitor.id, "out", ground.id, "gnd"))
+            previous = resistor.id
+
+        return components, connections
+
+    def led_array(self, count: int) -> Netlist:
+        """Parallel LEDs, each with its own current-limiting resistor"""
+        components, connections = self._source()
+        battery, ground = components
+
+        for _ in range(count):
+            resistor = self._component("resistor", resistance=self._resistance())
+            led = self._component(
+                "led",
+                forward_voltage=self.random.choice([1.8, 2.0, 2.2, 3.0, 3.2]),
+                forward_current=0.02
+            )
+            components += [resistor, led]
+            connections.append(self._connection(battery.id, "out", resistor.id, "in"))
+            connections.append(self._connection(resistor.id, "out", led.id, "anode"))
+            connections.append(self._connection(led.id, "cathode", ground.id, "gnd"))
+
+        return components, connections
+
+    def _source(self) -> Netlist:
+        """Battery and ground shared by every topology"""
+        battery = self._component("battery", voltage=self.random.choice([3.3, 5.0, 9.0, 12.0]))
+        ground = self._component("ground")
+        connection = self._connection(battery.id, "neg", ground.id, "gnd")
+        return [battery, ground], [connection]
+
+    def _component(self, component_type: str, **properties: Any) -> Component:
+        """Create a component with a unique ID and random position"""
+        self._component_count += 1
+        return Component(
+            id=f"{component_type}-{self._component_count}",
+            type=component_type,
+            name=f"{component_type.title()} {self._component_count}",
+            position={
+                "x": round(self.random.uniform(0, 2000), 1),
+                "y": round(self.random.uniform(0, 2000), 1)
+            },
+            rotation=self.random.choice([0.0, 90.0, 180.0, 270.0]),
+            properties=properties
+        )
+
+    def _connection(self, from_id: str, from_pin: str, to_id: str, to_pin: str) -> Connection:
+        """Create a connection with a unique ID"""
+        self._connection_count += 1
+        return Connection(
+            id=f"conn-{self._connection_count}",
+            from_component=from_id,
+            from_pin=from_pin,
+            to_component=to_id,
+            to_pin=to_pin
+        )
+
+    def _resistance(self) -> float:
+        """Pick an E12 resistance between 10 ohms and 1 megaohm"""
+        return self.random.choice(E12) * 10 ** self.random.randint(1, 5)
+
+
+def as_simulation_request(netlist: Netlist, **kwargs: Any) -> SimulationRequest:
+    """Wrap a generated netlist in a simulation request"""
+    components, connections = netlist
+    return SimulationRequest(components=components, connections=connections, **kwargs)
+
+
+def as_circuit_create(netlist: Netlist, name: str, **kwargs: Any) -> CircuitCreate:
+    """Wrap a generated netlist in a circuit creation request"""
+    components, connections = netlist
+    return CircuitCreate(name=name, components=components, connections=connections, **kwargs)
+
+
+def as_payload(model: Any) -> Dict[str, Any]:
+    """Serialize a request model to a JSON-compatible dict"""
+    return model.model_dump(mode="json")
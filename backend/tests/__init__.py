@@ -0,0 +1 @@
+# CircuitGen Backend Tests
@@ -0,0 +1,116 @@
+"""
+Tests for single-flight request coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.coalescing import SingleFlight, CoalescingLimitError, canonical_hash
+
+
+class CountingWork:
+    """Awaitable computation that records how often it runs"""
+
+    def __init__(self, delay: float = 0.05, result: str = "result", error: Exception = None):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.finished = False
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        self.finished = True
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_calls_share_one_computation():
+    flights = SingleFlight(max_waiters=50, timeout=1.0)
+    work = CountingWork()
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("key", work) for _ in range(20)))
+
+    results = asyncio.run(scenario())
+
+    assert results == ["result"] * 20
+    assert work.calls == 1
+    assert flights._flights == {}
+
+
+def test_different_keys_run_separately():
+    flights = SingleFlight(max_waiters=50, timeout=1.0)
+    work = CountingWork()
+
+    async def scenario():
+        return await asyncio.gather(flights.do("a", work), flights.do("b", work))
+
+    asyncio.run(scenario())
+
+    assert work.calls == 2
+
+
+def test_waiters_beyond_limit_are_rejected():
+    flights = SingleFlight(max_waiters=3, timeout=1.0)
+    work = CountingWork()
+
+    async def scenario():
+        return await asyncio.gather(
+            *(flights.do("key", work) for _ in range(5)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert results[:3] == ["result"] * 3
+    assert all(isinstance(result, CoalescingLimitError) for result in results[3:])
+    assert work.calls == 1
+
+
+def test_timeout_does_not_cancel_shared_computation():
+    flights = SingleFlight(max_waiters=50, timeout=0.01)
+    work = CountingWork(delay=0.05)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await flights.do("key", work)
+        assert "key" in flights._flights
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+
+    assert work.finished
+    assert flights._flights == {}
+
+
+def test_key_is_removed_after_failure():
+    flights = SingleFlight(max_waiters=50, timeout=1.0)
+    failing = CountingWork(error=ValueError("boom"))
+    working = CountingWork()
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(flights.do("key", failing) for _ in range(3)),
+            return_exceptions=True
+        )
+        assert flights._flights == {}
+        return results, await flights.do("key", working)
+
+    results, retry = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert failing.calls == 1
+    assert retry == "result"
+    assert working.calls == 1
+
+
+def test_canonical_hash_ignores_key_order():
+    first = {"time_step": 0.001, "components": [{"id": "r1", "type": "resistor"}]}
+    second = {"components": [{"type": "resistor", "id": "r1"}], "time_step": 0.001}
+
+    assert canonical_hash(first) == canonical_hash(second)
+    assert canonical_hash(first) != canonical_hash({**first, "time_step": 0.01})
@@ -0,0 +1,42 @@
+"""
+Tests for lazy database initialization
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.core import db  # noqa: E402
+
+
+def test_concurrent_init_creates_one_engine(monkeypatch):
+    created = []
+    real_create_engine = db.create_engine
+
+    def slow_create_engine(url, **kwargs):
+        time.sleep(0.01)  # Widen the race window
+        engine = real_create_engine("sqlite://")
+        created.append(engine)
+        return engine
+
+    monkeypatch.setattr(db, "engine", None)
+    monkeypatch.setattr(db, "create_engine", slow_create_engine)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def first_request():
+        barrier.wait()
+        results.append(db.init_db())
+
+    threads = [threading.Thread(target=first_request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+    assert db.SessionLocal.kw["bind"] is created[0]
@@ -0,0 +1,159 @@
+"""
+Tests for request and simulation metrics
+"""
+
+import pytest
+
+from app.core.metrics import Histogram, PhaseTimer
+
+
+def parse_samples(lines):
+    """Map each sample line's name and labels to its value"""
+    samples = {}
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_bucket_bounds_are_inclusive():
+    histogram = Histogram("test_seconds", "Test", ["path"], buckets=[0.1, 1.0])
+    histogram.observe(0.1, path="/a")
+    histogram.observe(1.0, path="/a")
+
+    samples = parse_samples(histogram.render())
+
+    assert samples['test_seconds_bucket{path="/a",le="0.1"}'] == 1
+    assert samples['test_seconds_bucket{path="/a",le="1.0"}'] == 2
+    assert samples['test_seconds_bucket{path="/a",le="+Inf"}'] == 2
+
+
+def test_bucket_counts_are_cumulative_and_count_matches_inf():
+    histogram = Histogram("test_seconds", "Test", ["path"], buckets=[0.1, 1.0, 10.0])
+    for value in (0.05, 0.5, 0.5, 5.0, 50.0):
+        histogram.observe(value, path="/a")
+
+    samples = parse_samples(histogram.render())
+
+    assert samples['test_seconds_bucket{path="/a",le="0.1"}'] == 1
+    assert samples['test_seconds_bucket{path="/a",le="1.0"}'] == 3
+    assert samples['test_seconds_bucket{path="/a",le="10.0"}'] == 4
+    assert samples['test_seconds_bucket{path="/a",le="+Inf"}'] == 5
+    assert samples['test_seconds_count{path="/a"}'] == 5
+    assert samples['test_seconds_sum{path="/a"}'] == pytest.approx(56.05)
+
+
+def test_series_are_kept_per_label_combination():
+    histogram = Histogram("test_seconds", "Test", ["path"], buckets=[1.0])
+    histogram.observe(0.5, path="/a")
+    histogram.observe(0.5, path="/b")
+    histogram.observe(0.5, path="/b")
+
+    samples = parse_samples(histogram.render())
+
+    assert samples['test_seconds_count{path="/a"}'] == 1
+    assert samples['test_seconds_count{path="/b"}'] == 2
+
+
+def test_label_values_are_escaped():
+    histogram = Histogram("test_seconds", "Test", ["path"], buckets=[1.0])
+    histogram.observe(0.5, path='a"b\\c\nd')
+
+    lines = histogram.render()
+
+    assert 'test_seconds_count{path="a\\"b\\\\c\\nd"} 1' in lines
+
+
+def test_render_includes_help_and_type():
+    histogram = Histogram("test_seconds", "Test histogram", ["path"])
+
+    assert histogram.render() == [
+        "# HELP test_seconds Test histogram",
+        "# TYPE test_seconds histogram",
+    ]
+
+
+def test_phase_timer_accumulates_repeated_phases():
+    timer = PhaseTimer()
+    with timer.phase("solve"):
+        pass
+    first = timer.timings["solve"]
+    with timer.phase("solve"):
+        pass
+
+    assert timer.timings["solve"] >= first >= 0.0
+    assert list(timer.timings) == ["solve"]
+
+
+def test_phase_timer_records_phase_that_raises():
+    timer = PhaseTimer()
+    with pytest.raises(ValueError):
+        with timer.phase("validate"):
+            raise ValueError("bad circuit")
+
+    assert "validate" in timer.timings
+
+
+def _middleware_client():
+    """Client for an app wired with the production metrics middleware"""
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.main import record_request_metrics
+
+    app = FastAPI()
+    app.middleware("http")(record_request_metrics)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("handler failed")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def _request_count(method: str, path: str, status: str) -> float:
+    from app.core.metrics import http_request_duration
+
+    samples = parse_samples(http_request_duration.render())
+    key = (
+        "circuitgen_http_request_duration_seconds_count"
+        f'{{method="{method}",path="{path}",status="{status}"}}'
+    )
+    return samples.get(key, 0)
+
+
+def test_middleware_labels_requests_by_route_template():
+    client = _middleware_client()
+    before = _request_count("GET", "/items/{item_id}", "200")
+
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert _request_count("GET", "/items/{item_id}", "200") == before + 2
+
+
+def test_middleware_labels_unknown_paths_as_unmatched():
+    client = _middleware_client()
+    before = _request_count("GET", "unmatched", "404")
+
+    response = client.get("/does-not-exist")
+
+    assert response.status_code == 404
+    assert _request_count("GET", "unmatched", "404") == before + 1
+
+
+def test_middleware_records_failed_handlers_as_500():
+    client = _middleware_client()
+    before = _request_count("GET", "/boom", "500")
+
+    response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert _request_count("GET", "/boom", "500") == before + 1
@@ -0,0 +1,67 @@
+"""
+Tests for simulation API helpers
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.api.simulate import _simulation_key  # noqa: E402
+from app.models.circuit_model import SimulationRequest  # noqa: E402
+
+
+def make_request(**overrides):
+    """Build a small battery and resistor circuit, applying overrides"""
+    battery = {
+        "id": "b1",
+        "type": "battery",
+        "name": "Battery",
+        "position": {"x": 0.0, "y": 0.0},
+        "properties": {"voltage": 9.0},
+    }
+    resistor = {
+        "id": "r1",
+        "type": "resistor",
+        "name": "Resistor",
+        "position": {"x": 100.0, "y": 0.0},
+        "properties": {"resistance": 1000.0},
+    }
+    connection = {
+        "id": "c1",
+        "from_component": "b1",
+        "from_pin": "out",
+        "to_component": "r1",
+        "to_pin": "in",
+    }
+    battery.update(overrides.pop("battery", {}))
+    resistor.update(overrides.pop("resistor", {}))
+    connection.update(overrides.pop("connection", {}))
+    payload = {
+        "components": [battery, resistor],
+        "connections": [connection],
+        **overrides,
+    }
+    return SimulationRequest(**payload)
+
+
+@pytest.mark.parametrize("overrides", [
+    {"resistor": {"name": "Renamed"}},
+    {"resistor": {"position": {"x": 250.0, "y": 75.0}}},
+    {"resistor": {"rotation": 90.0}},
+    {"connection": {"wire_points": [{"x": 50.0, "y": 10.0}]}},
+    {"connection": {"id": "other-connection"}},
+    {"circuit_id": 42},
+])
+def test_layout_only_changes_share_a_key(overrides):
+    assert _simulation_key(make_request(**overrides)) == _simulation_key(make_request())
+
+
+@pytest.mark.parametrize("overrides", [
+    {"resistor": {"properties": {"resistance": 2200.0}}},
+    {"resistor": {"type": "led"}},
+    {"connection": {"to_pin": "out"}},
+    {"simulation_time": 2.0},
+    {"time_step": 0.01},
+])
+def test_result_affecting_changes_get_a_new_key(overrides):
+    assert _simulation_key(make_request(**overrides)) != _simulation_key(make_request())